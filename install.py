@@ -2,24 +2,38 @@
 """
 Helper script to configure Claude Desktop with the YouTube Music MCP server
 """
+import functools
 import json
 import os
 from pathlib import Path
 import platform
 
+# Claude Desktop config location relative to each OS's base directory
+_MAC_REL = Path("Library/Application Support/Claude/claude_desktop_config.json")
+_WIN_REL = Path("Claude/claude_desktop_config.json")
+_LIN_REL = Path(".config/Claude/claude_desktop_config.json")
 
+_SYSTEM = platform.system()
+_CONFIG_REL = {"Darwin": _MAC_REL, "Windows": _WIN_REL}.get(_SYSTEM, _LIN_REL)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get Claude Desktop config path for current OS"""
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        return Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
-    elif system == "Windows":
+    if _SYSTEM == "Windows":
         appdata = os.getenv("APPDATA")
         if appdata:
-            return Path(appdata) / "Claude/claude_desktop_config.json"
+            return Path(appdata) / _CONFIG_REL
         raise RuntimeError("APPDATA environment variable not found")
-    else:  # Linux
-        return Path.home() / ".config/Claude/claude_desktop_config.json"
+    return Path.home() / _CONFIG_REL
+
+
+def write_config(config_path: Path, config: dict) -> None:
+    """Atomically replace the config file with the serialized config"""
+    payload = json.dumps(config, indent=2).encode("utf-8")
+    tmp_path = config_path.with_suffix(config_path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, config_path)
 
 
 def install_mcp_server():
@@ -31,13 +45,9 @@ def install_mcp_server():
     print(f"Config path: {config_path}")
 
     # Read existing config or create new one
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            try:
-                config = json.load(f)
-            except json.JSONDecodeError:
-                config = {}
-    else:
+    try:
+        config = json.loads(config_path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
         config = {}
 
     # Ensure mcpServers key exists
@@ -53,8 +63,7 @@ def install_mcp_server():
 
     # Write back
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    write_config(config_path, config)
 
     print(f"\nAdded YouTube Music MCP server to {config_path}")
     print("\nRestart Claude Desktop to use the new server.")
@@ -70,18 +79,16 @@ def uninstall_mcp_server():
         print("Claude Desktop config not found. Nothing to remove.")
         return
 
-    with open(config_path, "r") as f:
-        try:
-            config = json.load(f)
-        except json.JSONDecodeError:
-            print("Could not parse config file.")
-            return
+    try:
+        config = json.loads(config_path.read_bytes())
+    except json.JSONDecodeError:
+        print("Could not parse config file.")
+        return
 
     if "mcpServers" in config and "youtube-music" in config["mcpServers"]:
         del config["mcpServers"]["youtube-music"]
 
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        write_config(config_path, config)
 
         print(f"Removed YouTube Music MCP server from {config_path}")
         print("Restart Claude Desktop for changes to take effect.")
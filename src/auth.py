@@ -3,11 +3,16 @@ Authentication management for YouTube Data API
 """
 import os
 import json
+import functools
+import threading
 from pathlib import Path
+import httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 
 # Scopes required for YouTube Music operations
 SCOPES = ["https://www.googleapis.com/auth/youtube"]
@@ -16,6 +21,42 @@ CLIENT_SECRETS_FILE = "client_secret.json"
 TOKEN_FILE = "token.json"
 
 
+class ThreadLocalHttp:
+    """
+    Authorized Http that hands each thread its own connection.
+
+    httplib2 connections are not thread-safe, so requests executed from
+    worker threads each go through an AuthorizedHttp owned by that thread.
+    """
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _thread_http(self) -> AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._thread_http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._thread_http(), name)
+
+
+@functools.lru_cache(maxsize=1)
+def _discovery_document() -> str:
+    """YouTube v3 discovery document bundled with google-api-python-client"""
+    return get_static_doc("youtube", "v3")
+
+
+def build_youtube(credentials):
+    """Build a YouTube API resource that can execute requests from worker threads"""
+    return build_from_document(_discovery_document(), http=ThreadLocalHttp(credentials))
+
+
 class AuthManager:
     """Handles OAuth authentication for YouTube Data API"""
 
@@ -24,6 +65,7 @@ class AuthManager:
         self.client_secrets_file = Path(CLIENT_SECRETS_FILE)
         self.credentials = None
         self.youtube = None
+        self._cached_credentials = None
 
     def setup_oauth(self) -> None:
         """
@@ -57,19 +99,22 @@ class AuthManager:
         # Save the credentials
         with open(self.token_file, "w") as token:
             token.write(credentials.to_json())
+        self._cached_credentials = credentials
 
         print(f"\nCredentials saved to {self.token_file}")
         print("You can now use the MCP server!")
 
-    def load_auth(self):
-        """Load authenticated YouTube API client"""
-        credentials = None
-
-        # Load existing credentials
-        if self.token_file.exists():
-            credentials = Credentials.from_authorized_user_file(
+    def _get_credentials(self):
+        """Load credentials from the token file once and reuse them"""
+        if self._cached_credentials is None and self.token_file.exists():
+            self._cached_credentials = Credentials.from_authorized_user_file(
                 str(self.token_file), SCOPES
             )
+        return self._cached_credentials
+
+    def load_auth(self):
+        """Load authenticated YouTube API client"""
+        credentials = self._get_credentials()
 
         # If no valid credentials, run setup
         if not credentials or not credentials.valid:
@@ -86,25 +131,24 @@ class AuthManager:
                 )
 
         self.credentials = credentials
-        self.youtube = build("youtube", "v3", credentials=credentials)
+        self.youtube = build_youtube(credentials)
 
-        # Test the connection
+        return self.youtube
+
+    def validate_connection(self) -> None:
+        """Make a live API call to verify the loaded credentials work"""
+        youtube = self.youtube or self.load_auth()
         try:
-            self.youtube.channels().list(part="snippet", mine=True).execute()
+            youtube.channels().list(part="snippet", mine=True).execute()
         except Exception as e:
             raise RuntimeError(f"Failed to connect to YouTube API: {e}")
 
-        return self.youtube
-
     def is_authenticated(self) -> bool:
         """Check if valid authentication exists"""
-        if not self.token_file.exists():
-            return False
-
         try:
-            credentials = Credentials.from_authorized_user_file(
-                str(self.token_file), SCOPES
-            )
+            credentials = self._get_credentials()
+            if credentials is None:
+                return False
             return credentials.valid or (
                 credentials.expired and credentials.refresh_token
             )
@@ -113,5 +157,19 @@ class AuthManager:
 
 
 if __name__ == "__main__":
+    import sys
+
     auth = AuthManager()
-    auth.setup_oauth()
+    if len(sys.argv) > 1 and sys.argv[1] == "--check":
+        try:
+            auth.validate_connection()
+        except FileNotFoundError:
+            print("Error: OAuth not configured.")
+            print("Please run: python -m src.auth")
+            sys.exit(1)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print("Connected to YouTube API successfully.")
+    else:
+        auth.setup_oauth()
@@ -22,200 +22,204 @@ app = Server("youtube-music-mcp")
 ytmusic_client: YouTubeMusicClient = None
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """
-    List available MCP tools for YouTube Music.
-    """
-    return [
-        Tool(
-            name="search_youtube_music",
-            description="""
+# Tool definitions are static, so build them once at import
+_TOOLS = [
+    Tool(
+        name="search_youtube_music",
+        description="""
 Search for music on YouTube Music. Returns track information including
 videoId (needed for adding to playlists), title, artists, album, and duration.
 
 Use this to find songs before adding them to playlists.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'Manuel Göttsching E2-E4', 'Neu! Hallogallo')",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (1-100)",
-                        "default": 20,
-                        "minimum": 1,
-                        "maximum": 100,
-                    },
-                    "filter": {
-                        "type": "string",
-                        "description": "Filter results by type",
-                        "enum": ["songs", "videos", "albums", "artists", "playlists"],
-                        "default": "songs",
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'Manuel Göttsching E2-E4', 'Neu! Hallogallo')",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return (1-100)",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "filter": {
+                    "type": "string",
+                    "description": "Filter results by type",
+                    "enum": ["songs", "videos", "albums", "artists", "playlists"],
+                    "default": "songs",
                 },
-                "required": ["query"],
             },
-        ),
-        Tool(
-            name="create_youtube_music_playlist",
-            description="""
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="create_youtube_music_playlist",
+        description="""
 Create a new playlist on YouTube Music. Can optionally add tracks immediately.
 Returns the playlist ID and URL.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Playlist title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Playlist description",
-                        "default": "",
-                    },
-                    "privacy_status": {
-                        "type": "string",
-                        "description": "Playlist visibility",
-                        "enum": ["PRIVATE", "PUBLIC", "UNLISTED"],
-                        "default": "PRIVATE",
-                    },
-                    "video_ids": {
-                        "type": "array",
-                        "description": "Optional list of video IDs to add to playlist on creation",
-                        "items": {"type": "string"},
-                        "default": [],
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Playlist title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Playlist description",
+                    "default": "",
+                },
+                "privacy_status": {
+                    "type": "string",
+                    "description": "Playlist visibility",
+                    "enum": ["PRIVATE", "PUBLIC", "UNLISTED"],
+                    "default": "PRIVATE",
+                },
+                "video_ids": {
+                    "type": "array",
+                    "description": "Optional list of video IDs to add to playlist on creation",
+                    "items": {"type": "string"},
+                    "default": [],
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="add_tracks_to_playlist",
-            description="""
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="add_tracks_to_playlist",
+        description="""
 Add tracks to an existing YouTube Music playlist using video IDs.
 Get video IDs using the search_youtube_music tool first.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "Target playlist ID",
-                    },
-                    "video_ids": {
-                        "type": "array",
-                        "description": "List of video IDs to add",
-                        "items": {"type": "string"},
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "Target playlist ID",
+                },
+                "video_ids": {
+                    "type": "array",
+                    "description": "List of video IDs to add",
+                    "items": {"type": "string"},
                 },
-                "required": ["playlist_id", "video_ids"],
             },
-        ),
-        Tool(
-            name="search_and_add_to_playlist",
-            description="""
+            "required": ["playlist_id", "video_ids"],
+        },
+    ),
+    Tool(
+        name="search_and_add_to_playlist",
+        description="""
 Convenience tool that searches for tracks and adds the top result of each
 to a playlist in one operation. Useful for quickly building playlists from
 a list of song names.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "Target playlist ID",
-                    },
-                    "search_queries": {
-                        "type": "array",
-                        "description": "List of search queries (e.g., ['Artist - Song', 'Another Song'])",
-                        "items": {"type": "string"},
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "Target playlist ID",
+                },
+                "search_queries": {
+                    "type": "array",
+                    "description": "List of search queries (e.g., ['Artist - Song', 'Another Song'])",
+                    "items": {"type": "string"},
                 },
-                "required": ["playlist_id", "search_queries"],
             },
-        ),
-        Tool(
-            name="get_playlist_details",
-            description="""
+            "required": ["playlist_id", "search_queries"],
+        },
+    ),
+    Tool(
+        name="get_playlist_details",
+        description="""
 Retrieve details about a YouTube Music playlist including all tracks.
 Returns all tracks by default (no limit).
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "Playlist ID to retrieve",
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "Playlist ID to retrieve",
                 },
-                "required": ["playlist_id"],
             },
-        ),
-        Tool(
-            name="delete_playlist",
-            description="""
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="delete_playlist",
+        description="""
 Delete a YouTube Music playlist. This action cannot be undone.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "Playlist ID to delete",
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "Playlist ID to delete",
                 },
-                "required": ["playlist_id"],
             },
-        ),
-        Tool(
-            name="update_playlist",
-            description="""
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="update_playlist",
+        description="""
 Update a playlist's title and/or description.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "Playlist ID to update",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New playlist title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New playlist description",
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "Playlist ID to update",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New playlist title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New playlist description",
                 },
-                "required": ["playlist_id"],
             },
-        ),
-        Tool(
-            name="get_library_playlists",
-            description="""
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="get_library_playlists",
+        description="""
 Get the user's library playlists from YouTube Music.
 Returns a list of playlists with their IDs and titles.
-            """.strip(),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of playlists to return",
-                        "default": 25,
-                        "minimum": 1,
-                    },
+        """.strip(),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of playlists to return",
+                    "default": 25,
+                    "minimum": 1,
                 },
-                "required": [],
             },
-        ),
-    ]
+            "required": [],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    List available MCP tools for YouTube Music.
+    """
+    return _TOOLS
 
 
 @app.call_tool()
@@ -236,17 +240,16 @@ async def call_tool(
             if not results:
                 return [TextContent(type="text", text="No results found.")]
 
-            output_lines = [f"Found {len(results)} results:\n"]
-            for r in results:
-                artists = ", ".join([a["name"] for a in r["artists"]]) if r["artists"] else "Unknown Artist"
-                album_info = f" [{r['album']}]" if r.get("album") else ""
-                duration_info = f" ({r['duration']})" if r.get("duration") else ""
-                output_lines.append(
-                    f"- {r['title']} - {artists}{album_info}{duration_info}\n"
-                    f"  videoId: {r['videoId']}"
-                )
+            result_lines = "\n".join(
+                f"- {r['title']} - "
+                + (", ".join(a["name"] for a in r["artists"]) if r["artists"] else "Unknown Artist")
+                + (f" [{r['album']}]" if r.get("album") else "")
+                + (f" ({r['duration']})" if r.get("duration") else "")
+                + f"\n  videoId: {r['videoId']}"
+                for r in results
+            )
 
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            return [TextContent(type="text", text=f"Found {len(results)} results:\n\n{result_lines}")]
 
         elif name == "create_youtube_music_playlist":
             result = await ytmusic_client.create_playlist(
@@ -260,7 +263,12 @@ async def call_tool(
                     type="text",
                     text=f"Created playlist: {result['title']}\n"
                     f"Playlist ID: {result['playlistId']}\n"
-                    f"URL: {result['url']}",
+                    f"URL: {result['url']}"
+                    + (
+                        f"\nAdded {result['addedCount']}/{result['requestedCount']} tracks"
+                        if "addedCount" in result
+                        else ""
+                    ),
                 )
             ]
 
@@ -283,9 +291,11 @@ async def call_tool(
             )
 
             response_lines = [f"Added {result['addedCount']} tracks to playlist:\n"]
-            for track in result["addedTracks"]:
-                artists = ", ".join(track.get("artists", []))
-                response_lines.append(f"  {track['query']} -> {track['matched']} by {artists}")
+            if result["addedTracks"]:
+                response_lines.append("\n".join(
+                    f"  {t['query']} -> {t['matched']} by {', '.join(t.get('artists') or ())}"
+                    for t in result["addedTracks"]
+                ))
 
             if result["failedQueries"]:
                 response_lines.append(f"\nFailed to find: {', '.join(result['failedQueries'])}")
@@ -297,19 +307,22 @@ async def call_tool(
                 playlist_id=arguments["playlist_id"],
             )
 
-            output_lines = [
-                f"Playlist: {result['title']}",
-                f"Description: {result['description'] or 'No description'}",
-                f"Track Count: {result['trackCount']}",
-                "",
-                "Tracks:",
-            ]
-
-            for t in result["tracks"]:
-                artists = ", ".join([a.get("name", "") for a in t.get("artists", [])])
-                output_lines.append(f"  - {t.get('title', 'Unknown')} - {artists}")
+            header = (
+                f"Playlist: {result['title']}\n"
+                f"Description: {result['description'] or 'No description'}\n"
+                f"Track Count: {result['trackCount']}\n"
+                "\n"
+                "Tracks:"
+            )
+            track_lines = "\n".join(
+                f"  - {t.get('title', 'Unknown')} - "
+                + ", ".join(a.get("name", "") for a in t.get("artists", ()))
+                + (f" ({t['duration']})" if t.get("duration") else "")
+                for t in result["tracks"]
+            )
 
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            text = f"{header}\n{track_lines}" if track_lines else header
+            return [TextContent(type="text", text=text)]
 
         elif name == "delete_playlist":
             result = await ytmusic_client.delete_playlist(
@@ -336,12 +349,14 @@ async def call_tool(
             if not result:
                 return [TextContent(type="text", text="No playlists found in your library.")]
 
-            output_lines = [f"Found {len(result)} playlists:\n"]
-            for p in result:
-                count_info = f" ({p['count']} tracks)" if p.get("count") else ""
-                output_lines.append(f"  - {p['title']}{count_info}\n    playlistId: {p['playlistId']}")
+            playlist_lines = "\n".join(
+                f"  - {p['title']}"
+                + (f" ({p['count']} tracks)" if p.get("count") else "")
+                + f"\n    playlistId: {p['playlistId']}"
+                for p in result
+            )
 
-            return [TextContent(type="text", text="\n".join(output_lines))]
+            return [TextContent(type="text", text=f"Found {len(result)} playlists:\n\n{playlist_lines}")]
 
         else:
             raise ValueError(f"Unknown tool: {name}")
@@ -359,16 +374,15 @@ async def main():
     logger.info("Initializing YouTube Music authentication...")
     auth_manager = AuthManager()
 
-    if not auth_manager.is_authenticated():
-        logger.error("OAuth not configured. Run: python -m src.auth")
-        print("Error: OAuth not configured.")
-        print("Please run: python -m src.auth")
-        return
-
     try:
         ytmusic = auth_manager.load_auth()
         ytmusic_client = YouTubeMusicClient(ytmusic)
         logger.info("YouTube Music client initialized successfully")
+    except FileNotFoundError:
+        logger.error("OAuth not configured. Run: python -m src.auth")
+        print("Error: OAuth not configured.")
+        print("Please run: python -m src.auth")
+        return
     except Exception as e:
         logger.error(f"Failed to initialize client: {e}")
         print(f"Error: {e}")
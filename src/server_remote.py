@@ -3,10 +3,15 @@ Remote MCP Server for YouTube Music (HTTP/SSE transport)
 For deployment to Railway, Fly.io, etc.
 """
 import os
-import json
+import asyncio
 import base64
+import hashlib
 import logging
-from typing import Any, Sequence
+import tempfile
+import contextlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
@@ -15,16 +20,36 @@ from starlette.applications import Starlette
 from starlette.routing import Route, Mount
 from starlette.responses import JSONResponse
 import uvicorn
+from uvicorn.config import LOG_LEVELS
+import orjson
+import fastjsonschema
 
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 
+from .auth import build_youtube
 from .ytmusic_client import YouTubeMusicClient
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+
+def _log_level_name(name: str) -> str:
+    """Normalise a logging level name to uvicorn's spelling (WARN -> warning)"""
+    level = logging.getLevelName(name.upper())
+    if isinstance(level, int):
+        name = logging.getLevelName(level)
+    return name.lower()
+
+
+# Configure logging (quiet by default; set LOG_LEVEL=INFO or DEBUG to troubleshoot).
+# The same checked name goes to uvicorn, which accepts fewer aliases than logging.
+_REQUESTED_LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING")
+LOG_LEVEL = _log_level_name(_REQUESTED_LOG_LEVEL)
+_UNKNOWN_LOG_LEVEL = LOG_LEVEL not in LOG_LEVELS
+if _UNKNOWN_LOG_LEVEL:
+    LOG_LEVEL = "warning"
+logging.basicConfig(level=LOG_LEVELS[LOG_LEVEL])
 logger = logging.getLogger(__name__)
+if _UNKNOWN_LOG_LEVEL:
+    logger.warning("Unknown LOG_LEVEL %r, using WARNING", _REQUESTED_LOG_LEVEL)
 
 # Initialize MCP server
 app = Server("youtube-music-mcp")
@@ -32,26 +57,84 @@ app = Server("youtube-music-mcp")
 # Global client instance
 ytmusic_client: YouTubeMusicClient = None
 
+# Set once the background warmup has built the client (or failed to)
+_ready = asyncio.Event()
+_warmup_error: Exception = None
 
-def init_youtube_client():
-    """Initialize YouTube client from environment variables"""
-    global ytmusic_client
 
+# Line breaks that sneak into pasted or wrapped tokens, removed in one pass
+_LINE_BREAKS = b"\r\n"
+
+# Decoded credentials are cached here so later worker starts skip decoding,
+# and refreshed tokens survive worker restarts
+CREDENTIALS_CACHE_DIR = Path(os.environ.get("YOUTUBE_CREDENTIALS_CACHE_DIR", tempfile.gettempdir()))
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_REFRESH_RETRY = 30
+
+# keep_credentials_fresh sleeps through this so tests can stub it out
+_sleep = asyncio.sleep
+
+
+def _credentials_cache_path(token: str) -> Path:
+    """Cache file for the credentials decoded from a given env token"""
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    return CREDENTIALS_CACHE_DIR / f"ytmusic_creds_{digest}.json"
+
+
+def _load_cached_credentials(path: Path):
+    """Load previously cached credentials, or None if there are none"""
+    try:
+        return Credentials.from_authorized_user_file(str(path))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_credentials(credentials, path: Path) -> None:
+    """Atomically write credentials to the cache, readable only by this user"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(credentials.to_json())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache credentials at %s: %s", path, e)
+
+
+def load_credentials():
+    """
+    Read OAuth credentials from the environment token, or from its cache.
+
+    Only local work happens here, so a missing or unreadable token fails
+    server startup rather than surfacing later.
+
+    Returns:
+        The credentials, the path they are cached at, and whether that
+        cache needs rewriting
+    """
     # Get credentials from environment (supports base64 or raw JSON)
     token_json = os.environ.get("YOUTUBE_TOKEN_JSON")
     token_b64 = os.environ.get("YOUTUBE_TOKEN_B64")
 
-    if token_b64:
-        # Base64 encoded token (preferred - avoids escaping issues)
-        token_json = base64.b64decode(token_b64).decode("utf-8")
-
-    if not token_json:
+    if not (token_b64 or token_json):
         raise RuntimeError("YOUTUBE_TOKEN_JSON or YOUTUBE_TOKEN_B64 environment variable not set")
 
+    cache_path = _credentials_cache_path(token_b64 or token_json)
+    credentials = _load_cached_credentials(cache_path)
+    if credentials is not None:
+        return credentials, cache_path, False
+
     try:
-        # Clean any whitespace/newlines that might have snuck in
-        token_json = token_json.strip().replace('\n', '').replace('\r', '')
-        token_data = json.loads(token_json)
+        if token_b64:
+            # Base64 encoded token (preferred - avoids escaping issues)
+            token_bytes = base64.b64decode(token_b64)
+        else:
+            token_bytes = token_json.encode("utf-8")
+
+        # Clean any newlines that might have snuck in
+        token_data = orjson.loads(token_bytes.translate(None, _LINE_BREAKS))
         credentials = Credentials(
             token=token_data.get("token"),
             refresh_token=token_data.get("refresh_token"),
@@ -60,241 +143,367 @@ def init_youtube_client():
             client_secret=token_data.get("client_secret"),
             scopes=token_data.get("scopes", ["https://www.googleapis.com/auth/youtube"]),
         )
+    except Exception as e:
+        logger.error("Invalid YouTube token: %s", e)
+        raise RuntimeError(f"Invalid YouTube token: {str(e)}")
 
+    return credentials, cache_path, True
+
+
+def init_youtube_client(credentials, cache_path: Path, cache_stale: bool) -> None:
+    """
+    Build the YouTube client, refreshing the access token first if it has expired.
+
+    Blocks on the network, so the server runs it in a worker thread.
+    """
+    global ytmusic_client
+
+    try:
         # Refresh if expired
         if credentials.expired and credentials.refresh_token:
             credentials.refresh(Request())
+            cache_stale = True
 
-        youtube = build("youtube", "v3", credentials=credentials)
+        if cache_stale:
+            _save_cached_credentials(credentials, cache_path)
+
+        youtube = build_youtube(credentials)
         ytmusic_client = YouTubeMusicClient(youtube)
         logger.info("YouTube client initialized successfully")
 
     except Exception as e:
-        logger.error(f"Failed to initialize YouTube client: {e}")
+        logger.error("Failed to initialize YouTube client: %s", e)
         raise
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools for YouTube Music."""
-    return [
-        Tool(
-            name="search_youtube_music",
-            description="Search for music on YouTube. Returns track info including videoId for playlists.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'Neu! Hallogallo')",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Max results (1-50)",
-                        "default": 20,
-                    },
+async def keep_credentials_fresh(credentials, cache_path: Path) -> None:
+    """Refresh the access token shortly before it expires, so requests never wait on it"""
+    while True:
+        if credentials.expiry is not None:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            delay = (credentials.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN
+            await _sleep(max(delay, 0))
+
+        try:
+            await asyncio.to_thread(credentials.refresh, Request())
+            _save_cached_credentials(credentials, cache_path)
+            logger.info("Refreshed YouTube access token")
+        except Exception as e:
+            logger.warning("Background token refresh failed: %s", e)
+            await _sleep(TOKEN_REFRESH_RETRY)
+
+
+async def warmup(credentials, cache_path: Path, cache_stale: bool) -> None:
+    """Build the YouTube client off the event loop, then keep its token fresh"""
+    global _warmup_error
+
+    try:
+        await asyncio.to_thread(init_youtube_client, credentials, cache_path, cache_stale)
+    except Exception as e:
+        _warmup_error = e
+        return
+    finally:
+        _ready.set()
+
+    if credentials.refresh_token:
+        await keep_credentials_fresh(credentials, cache_path)
+
+
+async def wait_until_ready() -> None:
+    """Wait for warmup to finish, raising its error if the client could not be built"""
+    await _ready.wait()
+    if _warmup_error is not None:
+        raise RuntimeError(f"YouTube client unavailable: {_warmup_error}")
+
+
+# Tool definitions are static, so build them once at import
+_TOOLS = [
+    Tool(
+        name="search_youtube_music",
+        description="Search for music on YouTube. Returns track info including videoId for playlists.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'Neu! Hallogallo')",
                 },
-                "required": ["query"],
-            },
-        ),
-        Tool(
-            name="create_playlist",
-            description="Create a new YouTube playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Playlist title"},
-                    "description": {"type": "string", "description": "Playlist description", "default": ""},
-                    "privacy_status": {
-                        "type": "string",
-                        "enum": ["private", "public", "unlisted"],
-                        "default": "private",
-                    },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max results (1-50)",
+                    "default": 20,
                 },
-                "required": ["title"],
             },
-        ),
-        Tool(
-            name="add_to_playlist",
-            description="Add videos to an existing playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {"type": "string", "description": "Target playlist ID"},
-                    "video_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Video IDs to add",
-                    },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="create_playlist",
+        description="Create a new YouTube playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Playlist title"},
+                "description": {"type": "string", "description": "Playlist description", "default": ""},
+                "privacy_status": {
+                    "type": "string",
+                    "enum": ["private", "public", "unlisted"],
+                    "default": "private",
                 },
-                "required": ["playlist_id", "video_ids"],
             },
-        ),
-        Tool(
-            name="get_my_playlists",
-            description="Get your YouTube playlists.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer", "default": 25},
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="add_to_playlist",
+        description="Add videos to an existing playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {"type": "string", "description": "Target playlist ID"},
+                "video_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Video IDs to add",
                 },
             },
-        ),
-        Tool(
-            name="search_and_add",
-            description="Search for songs and add top results to a playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {"type": "string", "description": "Target playlist ID"},
-                    "queries": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Search queries (e.g., ['Artist - Song'])",
-                    },
-                },
-                "required": ["playlist_id", "queries"],
+            "required": ["playlist_id", "video_ids"],
+        },
+    ),
+    Tool(
+        name="get_my_playlists",
+        description="Get your YouTube playlists.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "default": 25},
             },
-        ),
-        Tool(
-            name="get_playlist_details",
-            description="Get details and all tracks from a YouTube playlist. Returns all tracks by default (no limit).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {"type": "string", "description": "Playlist ID to retrieve"},
+        },
+    ),
+    Tool(
+        name="search_and_add",
+        description="Search for songs and add top results to a playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {"type": "string", "description": "Target playlist ID"},
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Search queries (e.g., ['Artist - Song'])",
                 },
-                "required": ["playlist_id"],
             },
-        ),
-        Tool(
-            name="delete_playlist",
-            description="Delete a YouTube playlist. This action cannot be undone.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {"type": "string", "description": "Playlist ID to delete"},
-                },
-                "required": ["playlist_id"],
+            "required": ["playlist_id", "queries"],
+        },
+    ),
+    Tool(
+        name="get_playlist_details",
+        description="Get details and all tracks from a YouTube playlist. Returns all tracks by default (no limit).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {"type": "string", "description": "Playlist ID to retrieve"},
             },
-        ),
-        Tool(
-            name="update_playlist",
-            description="Update a playlist's title and/or description.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {"type": "string", "description": "Playlist ID to update"},
-                    "title": {"type": "string", "description": "New playlist title"},
-                    "description": {"type": "string", "description": "New playlist description"},
-                },
-                "required": ["playlist_id"],
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="delete_playlist",
+        description="Delete a YouTube playlist. This action cannot be undone.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {"type": "string", "description": "Playlist ID to delete"},
             },
-        ),
-    ]
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="update_playlist",
+        description="Update a playlist's title and/or description.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {"type": "string", "description": "Playlist ID to update"},
+                "title": {"type": "string", "description": "New playlist title"},
+                "description": {"type": "string", "description": "New playlist description"},
+            },
+            "required": ["playlist_id"],
+        },
+    ),
+]
 
 
-@app.call_tool()
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools for YouTube Music."""
+    return _TOOLS
+
+
+# Argument validators generated from each tool's inputSchema, compiled once at import
+_VALIDATORS = {t.name: fastjsonschema.compile(t.inputSchema) for t in _TOOLS}
+
+# Tool handlers keyed by tool name, registered with @tool
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {}
+
+
+def tool(name: str):
+    """Register the decorated coroutine as the handler for an MCP tool"""
+    def register(handler):
+        _HANDLERS[name] = handler
+        return handler
+    return register
+
+
+@tool("search_youtube_music")
+async def _handle_search(arguments: dict) -> list[TextContent]:
+    results = await ytmusic_client.search_tracks(
+        query=arguments["query"],
+        limit=arguments.get("limit", 20),
+    )
+    if not results:
+        return [TextContent(type="text", text="No results found.")]
+
+    body = "\n".join(
+        f"- {r['title']} by {r['artists'][0]['name'] if r['artists'] else 'Unknown'}\n"
+        f"  videoId: {r['videoId']}"
+        for r in results
+    )
+    return [TextContent(type="text", text=f"Found {len(results)} results:\n\n{body}")]
+
+
+@tool("create_playlist")
+async def _handle_create_playlist(arguments: dict) -> list[TextContent]:
+    result = await ytmusic_client.create_playlist(
+        title=arguments["title"],
+        description=arguments.get("description", ""),
+        privacy_status=arguments.get("privacy_status", "private"),
+    )
+    return [TextContent(
+        type="text",
+        text=f"Created: {result['title']}\nID: {result['playlistId']}\nURL: {result['url']}"
+    )]
+
+
+@tool("add_to_playlist")
+async def _handle_add_to_playlist(arguments: dict) -> list[TextContent]:
+    result = await ytmusic_client.add_playlist_items(
+        playlist_id=arguments["playlist_id"],
+        video_ids=arguments["video_ids"],
+    )
+    return [TextContent(
+        type="text",
+        text=f"Added {result['addedCount']} tracks to playlist"
+    )]
+
+
+@tool("get_my_playlists")
+async def _handle_get_my_playlists(arguments: dict) -> list[TextContent]:
+    playlists = await ytmusic_client.get_library_playlists(
+        limit=arguments.get("limit", 25)
+    )
+    if not playlists:
+        return [TextContent(type="text", text="No playlists found.")]
+
+    body = "\n".join(
+        f"- {p['title']} ({p['count']} tracks)\n  ID: {p['playlistId']}"
+        for p in playlists
+    )
+    return [TextContent(type="text", text=f"Your playlists ({len(playlists)}):\n\n{body}")]
+
+
+@tool("search_and_add")
+async def _handle_search_and_add(arguments: dict) -> list[TextContent]:
+    result = await ytmusic_client.search_and_add_to_playlist(
+        playlist_id=arguments["playlist_id"],
+        search_queries=arguments["queries"],
+    )
+    lines = [f"Added {result['addedCount']} tracks:\n"]
+    for t in result["addedTracks"]:
+        lines.append(f"  ✓ {t['query']} → {t['matched']}")
+    if result["failedQueries"]:
+        lines.append(f"\nFailed: {', '.join(result['failedQueries'])}")
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+async def _report_progress(progress: float, total: float | None = None) -> None:
+    """Send an MCP progress notification if the caller asked for progress"""
+    try:
+        ctx = app.request_context
+    except LookupError:
+        return
+    if ctx.meta and ctx.meta.progressToken is not None:
+        await ctx.session.send_progress_notification(ctx.meta.progressToken, progress, total)
+
+
+@tool("get_playlist_details")
+async def _handle_get_playlist_details(arguments: dict) -> list[TextContent]:
+    # One content block per page, with a progress notification as each arrives
+    chunks = []
+    fetched = 0
+
+    async def on_page(page, info):
+        nonlocal fetched
+        if not page:
+            return
+        fetched += len(page)
+        chunks.append(TextContent(type="text", text="\n".join(
+            f"  - {t['title']} - {t['artists'][0]['name'] if t.get('artists') else 'Unknown'}"
+            + (f" ({t['duration']})" if t.get("duration") else "")
+            for t in page
+        )))
+        await _report_progress(fetched, info["trackCount"] if info else None)
+
+    result = await ytmusic_client.stream_playlist(arguments["playlist_id"], on_page)
+    header = (
+        f"Playlist: {result['title']}\n"
+        f"Description: {result['description'] or 'No description'}\n"
+        f"Tracks ({result['trackCount']}):\n"
+    )
+    return [TextContent(type="text", text=header), *chunks]
+
+
+@tool("delete_playlist")
+async def _handle_delete_playlist(arguments: dict) -> list[TextContent]:
+    result = await ytmusic_client.delete_playlist(
+        playlist_id=arguments["playlist_id"],
+    )
+    return [TextContent(type="text", text=f"Deleted playlist: {result['playlistId']}")]
+
+
+@tool("update_playlist")
+async def _handle_update_playlist(arguments: dict) -> list[TextContent]:
+    result = await ytmusic_client.update_playlist(
+        playlist_id=arguments["playlist_id"],
+        title=arguments.get("title"),
+        description=arguments.get("description"),
+    )
+    return [TextContent(
+        type="text",
+        text=f"Updated playlist: {result['title']}\nDescription: {result['description']}"
+    )]
+
+
+# Arguments are checked against the precompiled _VALIDATORS instead
+@app.call_tool(validate_input=False)
 async def call_tool(
     name: str, arguments: Any
 ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
     """Handle tool calls."""
-    try:
-        if name == "search_youtube_music":
-            results = await ytmusic_client.search_tracks(
-                query=arguments["query"],
-                limit=arguments.get("limit", 20),
-            )
-            if not results:
-                return [TextContent(type="text", text="No results found.")]
-
-            lines = [f"Found {len(results)} results:\n"]
-            for r in results:
-                artist = r["artists"][0]["name"] if r["artists"] else "Unknown"
-                lines.append(f"- {r['title']} by {artist}\n  videoId: {r['videoId']}")
-            return [TextContent(type="text", text="\n".join(lines))]
-
-        elif name == "create_playlist":
-            result = await ytmusic_client.create_playlist(
-                title=arguments["title"],
-                description=arguments.get("description", ""),
-                privacy_status=arguments.get("privacy_status", "private"),
-            )
-            return [TextContent(
-                type="text",
-                text=f"Created: {result['title']}\nID: {result['playlistId']}\nURL: {result['url']}"
-            )]
-
-        elif name == "add_to_playlist":
-            result = await ytmusic_client.add_playlist_items(
-                playlist_id=arguments["playlist_id"],
-                video_ids=arguments["video_ids"],
-            )
-            return [TextContent(
-                type="text",
-                text=f"Added {result['addedCount']} tracks to playlist"
-            )]
-
-        elif name == "get_my_playlists":
-            playlists = await ytmusic_client.get_library_playlists(
-                limit=arguments.get("limit", 25)
-            )
-            if not playlists:
-                return [TextContent(type="text", text="No playlists found.")]
-
-            lines = [f"Your playlists ({len(playlists)}):\n"]
-            for p in playlists:
-                lines.append(f"- {p['title']} ({p['count']} tracks)\n  ID: {p['playlistId']}")
-            return [TextContent(type="text", text="\n".join(lines))]
-
-        elif name == "search_and_add":
-            result = await ytmusic_client.search_and_add_to_playlist(
-                playlist_id=arguments["playlist_id"],
-                search_queries=arguments["queries"],
-            )
-            lines = [f"Added {result['addedCount']} tracks:\n"]
-            for t in result["addedTracks"]:
-                lines.append(f"  ✓ {t['query']} → {t['matched']}")
-            if result["failedQueries"]:
-                lines.append(f"\nFailed: {', '.join(result['failedQueries'])}")
-            return [TextContent(type="text", text="\n".join(lines))]
-
-        elif name == "get_playlist_details":
-            result = await ytmusic_client.get_playlist(
-                playlist_id=arguments["playlist_id"],
-            )
-            lines = [
-                f"Playlist: {result['title']}",
-                f"Description: {result['description'] or 'No description'}",
-                f"Tracks ({result['trackCount']}):\n",
-            ]
-            for t in result["tracks"]:
-                artist = t["artists"][0]["name"] if t.get("artists") else "Unknown"
-                lines.append(f"  - {t['title']} - {artist}")
-            return [TextContent(type="text", text="\n".join(lines))]
-
-        elif name == "delete_playlist":
-            result = await ytmusic_client.delete_playlist(
-                playlist_id=arguments["playlist_id"],
-            )
-            return [TextContent(type="text", text=f"Deleted playlist: {result['playlistId']}")]
-
-        elif name == "update_playlist":
-            result = await ytmusic_client.update_playlist(
-                playlist_id=arguments["playlist_id"],
-                title=arguments.get("title"),
-                description=arguments.get("description"),
-            )
-            return [TextContent(
-                type="text",
-                text=f"Updated playlist: {result['title']}\nDescription: {result['description']}"
-            )]
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    try:
+        arguments = _VALIDATORS[name](arguments or {})
+    except fastjsonschema.JsonSchemaException as e:
+        return [TextContent(type="text", text=f"Invalid args: {e.message}")]
 
+    try:
+        await wait_until_ready()
+        return await handler(arguments)
     except Exception as e:
-        logger.error(f"Tool error: {e}")
+        logger.error("Tool error: %s", e)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
@@ -312,15 +521,38 @@ async def handle_sse(request):
         )
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 async def handle_messages(request):
     """Handle POST messages for MCP"""
     await sse.handle_post_message(request.scope, request.receive, request._send)
-    return JSONResponse({"status": "ok"})
+    return ORJSONResponse({"status": "ok"})
 
 
 async def health(request):
-    """Health check endpoint"""
-    return JSONResponse({"status": "ok", "service": "youtube-music-mcp"})
+    """Health check endpoint; unhealthy once the YouTube client has failed to build"""
+    if _warmup_error is not None:
+        return ORJSONResponse(
+            {"status": "error", "service": "youtube-music-mcp", "error": str(_warmup_error)},
+            status_code=503,
+        )
+    return ORJSONResponse({"status": "ok", "service": "youtube-music-mcp"})
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Fail fast on a bad token, then build the YouTube client without holding up the port bind"""
+    credentials, cache_path, cache_stale = load_credentials()
+    warmup_task = asyncio.create_task(warmup(credentials, cache_path, cache_stale))
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
 
 
 # Starlette app with routes
@@ -331,17 +563,40 @@ starlette_app = Starlette(
         Route("/sse", handle_sse),
         Route("/messages/", handle_messages, methods=["POST"]),
     ],
+    lifespan=lifespan,
 )
 
 
 def main():
     """Run the HTTP server"""
-    init_youtube_client()
-
     port = int(os.environ.get("PORT", 8000))
-    logger.info(f"Starting server on port {port}")
+    workers = int(os.environ.get("UVICORN_WORKERS", os.environ.get("WEB_CONCURRENCY", "1")))
+    logger.info("Starting server on port %s with %s worker(s)", port, workers)
 
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+    # uvloop and httptools are faster, but uvloop is unavailable on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    # uvicorn can only spawn multiple workers from an import string
+    uvicorn.run(
+        "src.server_remote:starlette_app" if workers > 1 else starlette_app,
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        log_level=LOG_LEVEL,
+        log_config=None,
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":
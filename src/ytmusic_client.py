@@ -1,11 +1,59 @@
 """
 YouTube Music API client using official YouTube Data API v3
 """
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Optional
+import asyncio
 import logging
+import re
+
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# How long (seconds) read results are served from memory before re-fetching
+SEARCH_CACHE_TTL = 300
+PLAYLIST_CACHE_TTL = 60
+
+# Partial-response field masks: only fetch the keys the client reads
+SEARCH_FIELDS = (
+    "items(id(videoId,playlistId),"
+    "snippet(title,channelTitle,channelId,description,thumbnails,publishedAt))"
+)
+PLAYLIST_FIELDS = "items(snippet(title,description),contentDetails(itemCount))"
+PLAYLIST_ITEMS_FIELDS = (
+    "nextPageToken,"
+    "items(snippet(title,position,videoOwnerChannelTitle,resourceId(videoId)))"
+)
+LIBRARY_FIELDS = "items(id,snippet(title,description),contentDetails(itemCount))"
+VIDEO_DETAILS_FIELDS = "items(id,snippet(channelTitle),contentDetails(duration))"
+
+# videos.list accepts at most this many comma-separated IDs per call
+VIDEOS_PER_REQUEST = 50
+
+# Map search filter to YouTube API type
+_TYPE_MAP = {
+    "songs": "video",
+    "videos": "video",
+    "playlists": "playlist",
+}
+_MUSIC_RE = re.compile(r"music", re.IGNORECASE)
+_DURATION_RE = re.compile(r"P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+def _format_duration(iso_duration: str) -> Optional[str]:
+    """Format an ISO 8601 duration such as PT4M13S as 4:13 (or 1:02:03)"""
+    match = _DURATION_RE.fullmatch(iso_duration or "")
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(g or 0) for g in match.groups())
+    # Live streams and upcoming premieres report P0D; show no duration for them
+    if not (days or hours or minutes or seconds):
+        return None
+    hours += days * 24
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
 
 class YouTubeMusicClient:
     """Wrapper around YouTube Data API for music operations"""
@@ -18,6 +66,32 @@ class YouTubeMusicClient:
             youtube: Authenticated googleapiclient YouTube resource
         """
         self.youtube = youtube
+        self._search_cache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+        self._playlist_cache = TTLCache(maxsize=128, ttl=PLAYLIST_CACHE_TTL)
+        self._library_cache = TTLCache(maxsize=8, ttl=PLAYLIST_CACHE_TTL)
+
+    def invalidate(self, playlist_id: Optional[str] = None) -> None:
+        """
+        Drop cached playlist reads so the next request goes to the API.
+
+        Args:
+            playlist_id: Playlist whose cached details to drop (all when None)
+        """
+        self._library_cache.clear()
+        if playlist_id is None:
+            self._playlist_cache.clear()
+            return
+        for key in [k for k in self._playlist_cache if k[0] == playlist_id]:
+            self._playlist_cache.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Drop every cached search and playlist read"""
+        self._search_cache.clear()
+        self.invalidate()
+
+    async def _execute(self, request) -> Dict[str, Any]:
+        """Execute an API request in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(request.execute)
 
     async def search_tracks(
         self, query: str, limit: int = 20, filter: str = "songs"
@@ -33,18 +107,16 @@ class YouTubeMusicClient:
         Returns:
             List of search results with videoId, title, channel info
         """
+        cache_key = (query, limit, filter)
+        if cache_key in self._search_cache:
+            return self._search_cache[cache_key]
+
         try:
-            # Map filter to YouTube API type
-            type_map = {
-                "songs": "video",
-                "videos": "video",
-                "playlists": "playlist",
-            }
-            search_type = type_map.get(filter, "video")
+            search_type = _TYPE_MAP.get(filter, "video")
 
             # For music, add "music" to query if searching for songs
             search_query = query
-            if filter == "songs" and "music" not in query.lower():
+            if filter == "songs" and not _MUSIC_RE.search(query):
                 search_query = f"{query} music"
 
             request = self.youtube.search().list(
@@ -53,8 +125,9 @@ class YouTubeMusicClient:
                 type=search_type,
                 maxResults=min(limit, 50),
                 videoCategoryId="10" if filter == "songs" else None,  # Music category
+                fields=SEARCH_FIELDS,
             )
-            response = request.execute()
+            response = await self._execute(request)
 
             results = []
             for item in response.get("items", []):
@@ -74,10 +147,11 @@ class YouTubeMusicClient:
                     "publishedAt": snippet.get("publishedAt"),
                 })
 
+            self._search_cache[cache_key] = results
             return results
 
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise RuntimeError(f"Search failed: {str(e)}")
 
     async def create_playlist(
@@ -97,7 +171,8 @@ class YouTubeMusicClient:
             video_ids: Optional list of video IDs to add initially
 
         Returns:
-            Dict with playlistId and status
+            Dict with playlistId, status and, when video_ids is given,
+            addedCount (tracks that failed to insert are skipped)
         """
         try:
             # Create the playlist
@@ -113,25 +188,29 @@ class YouTubeMusicClient:
                     },
                 },
             )
-            response = request.execute()
+            response = await self._execute(request)
             playlist_id = response["id"]
-
-            # Add initial videos if provided
-            if video_ids:
-                for video_id in video_ids:
-                    await self._add_video_to_playlist(playlist_id, video_id)
-
-            return {
-                "playlistId": playlist_id,
-                "title": title,
-                "status": "created",
-                "url": f"https://www.youtube.com/playlist?list={playlist_id}",
-            }
+            self.invalidate(playlist_id)
 
         except Exception as e:
-            logger.error(f"Playlist creation failed: {e}")
+            logger.error("Playlist creation failed: %s", e)
             raise RuntimeError(f"Failed to create playlist: {str(e)}")
 
+        result = {
+            "playlistId": playlist_id,
+            "title": title,
+            "status": "created",
+            "url": f"https://www.youtube.com/playlist?list={playlist_id}",
+        }
+
+        # Add initial videos if provided; the playlist exists even if some fail
+        if video_ids:
+            added = await self.add_playlist_items(playlist_id, video_ids)
+            result["addedCount"] = added["addedCount"]
+            result["requestedCount"] = added["requestedCount"]
+
+        return result
+
     async def _add_video_to_playlist(self, playlist_id: str, video_id: str) -> Dict:
         """Add a single video to a playlist"""
         request = self.youtube.playlistItems().insert(
@@ -146,7 +225,7 @@ class YouTubeMusicClient:
                 },
             },
         )
-        return request.execute()
+        return await self._execute(request)
 
     async def add_playlist_items(
         self, playlist_id: str, video_ids: List[str]
@@ -162,14 +241,16 @@ class YouTubeMusicClient:
             Status information
         """
         try:
+            # playlistItems.insert appends, so inserts run one at a time to keep the order
             added = 0
             for video_id in video_ids:
                 try:
                     await self._add_video_to_playlist(playlist_id, video_id)
                     added += 1
                 except Exception as e:
-                    logger.warning(f"Failed to add video {video_id}: {e}")
+                    logger.warning("Failed to add video %s: %s", video_id, e)
 
+            self.invalidate(playlist_id)
             return {
                 "status": "success",
                 "playlistId": playlist_id,
@@ -178,42 +259,115 @@ class YouTubeMusicClient:
             }
 
         except Exception as e:
-            logger.error(f"Failed to add items to playlist: {e}")
+            logger.error("Failed to add items to playlist: %s", e)
             raise RuntimeError(f"Failed to add tracks: {str(e)}")
 
-    async def get_playlist(
-        self, playlist_id: str, limit: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Get playlist details and all tracks (paginated)"""
+    def _playlist_items_request(self, playlist_id: str, page_token: Optional[str] = None):
+        """Build the request for one 50-item page of a playlist"""
+        return self.youtube.playlistItems().list(
+            part="snippet",
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token,
+            fields=PLAYLIST_ITEMS_FIELDS,
+        )
+
+    async def get_playlist_info(self, playlist_id: str) -> Dict[str, Any]:
+        """Get playlist title, description and track count"""
         try:
-            # Get playlist metadata
-            playlist_request = self.youtube.playlists().list(
+            response = await self._execute(self.youtube.playlists().list(
                 part="snippet,contentDetails",
                 id=playlist_id,
-            )
-            playlist_response = playlist_request.execute()
+                fields=PLAYLIST_FIELDS,
+            ))
 
-            if not playlist_response.get("items"):
+            if not response.get("items"):
                 raise RuntimeError(f"Playlist not found: {playlist_id}")
 
-            playlist_info = playlist_response["items"][0]
+            playlist_info = response["items"][0]
             snippet = playlist_info.get("snippet", {})
-            total_tracks = playlist_info.get("contentDetails", {}).get("itemCount", 0)
-
-            # Get all playlist items with pagination
-            tracks = []
-            next_page_token = None
-
-            while True:
-                items_request = self.youtube.playlistItems().list(
-                    part="snippet",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token,
-                )
-                items_response = items_request.execute()
-
-                for item in items_response.get("items", []):
+            return {
+                "id": playlist_id,
+                "title": snippet.get("title"),
+                "description": snippet.get("description"),
+                "trackCount": playlist_info.get("contentDetails", {}).get("itemCount", 0),
+            }
+
+        except Exception as e:
+            logger.error("Failed to get playlist: %s", e)
+            raise RuntimeError(f"Failed to retrieve playlist: {str(e)}")
+
+    async def get_video_details(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up channel and duration for videos, 50 IDs per request.
+
+        Args:
+            video_ids: Video IDs to look up
+
+        Returns:
+            Dict mapping video ID to {"channel", "duration"}; videos that are
+            private or deleted are left out
+        """
+        video_ids = [video_id for video_id in video_ids if video_id]
+        responses = await asyncio.gather(*(
+            self._execute(self.youtube.videos().list(
+                part="snippet,contentDetails",
+                id=",".join(video_ids[i:i + VIDEOS_PER_REQUEST]),
+                fields=VIDEO_DETAILS_FIELDS,
+            ))
+            for i in range(0, len(video_ids), VIDEOS_PER_REQUEST)
+        ))
+
+        details = {}
+        for response in responses:
+            for item in response.get("items", []):
+                details[item["id"]] = {
+                    "channel": item.get("snippet", {}).get("channelTitle"),
+                    "duration": _format_duration(item.get("contentDetails", {}).get("duration")),
+                }
+        return details
+
+    async def iter_playlist(
+        self, playlist_id: str, limit: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream a playlist's tracks page by page as they arrive.
+
+        The next page is requested before the current one is handed out,
+        so fetching overlaps with whatever the caller does with each page.
+
+        Args:
+            playlist_id: Playlist to read
+            limit: Maximum number of tracks (all when None)
+
+        Yields:
+            Lists of track dicts, one per page of up to 50 items
+        """
+        count = 0
+        page = asyncio.create_task(self._execute(self._playlist_items_request(playlist_id)))
+
+        try:
+            while page is not None:
+                try:
+                    items_response = await page
+                except Exception as e:
+                    logger.error("Failed to get playlist: %s", e)
+                    raise RuntimeError(f"Failed to retrieve playlist: {str(e)}")
+                page = None
+
+                items = items_response.get("items", [])
+                if limit:
+                    items = items[:limit - count]
+                count += len(items)
+
+                next_page_token = items_response.get("nextPageToken")
+                if next_page_token and not (limit and count >= limit):
+                    page = asyncio.create_task(self._execute(
+                        self._playlist_items_request(playlist_id, next_page_token)
+                    ))
+
+                tracks = []
+                for item in items:
                     item_snippet = item.get("snippet", {})
                     resource_id = item_snippet.get("resourceId", {})
                     tracks.append({
@@ -223,33 +377,82 @@ class YouTubeMusicClient:
                         "position": item_snippet.get("position"),
                     })
 
-                    # Stop if we've reached the limit
-                    if limit and len(tracks) >= limit:
-                        break
+                # One batched videos.list call per page, overlapping the next page fetch
+                try:
+                    details = await self.get_video_details([t["videoId"] for t in tracks])
+                except Exception as e:
+                    logger.warning("Failed to get track details: %s", e)
+                    details = {}
+                for track in tracks:
+                    video = details.get(track["videoId"])
+                    if video:
+                        track["duration"] = video["duration"]
+                        if not track["artists"][0]["name"] and video["channel"]:
+                            track["artists"] = [{"name": video["channel"]}]
+                yield tracks
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def stream_playlist(
+        self,
+        playlist_id: str,
+        on_page: Optional[Callable[[List[Dict[str, Any]], Optional[Dict[str, Any]]], Awaitable[None]]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch playlist metadata and tracks side by side, reporting each page as it arrives.
 
-                next_page_token = items_response.get("nextPageToken")
-                if not next_page_token or (limit and len(tracks) >= limit):
-                    break
+        Args:
+            playlist_id: Playlist to read
+            on_page: Awaited with each page of tracks and the playlist info
+                (None until the metadata request has finished)
+            limit: Maximum number of tracks (all when None)
 
-            return {
-                "id": playlist_id,
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "trackCount": total_tracks,
-                "tracks": tracks,
-            }
+        Returns:
+            Playlist info with all tracks
+        """
+        cache_key = (playlist_id, limit)
+        if cache_key in self._playlist_cache:
+            playlist = self._playlist_cache[cache_key]
+            if on_page:
+                info = {k: v for k, v in playlist.items() if k != "tracks"}
+                await on_page(playlist["tracks"], info)
+            return playlist
+
+        info = asyncio.create_task(self.get_playlist_info(playlist_id))
+        tracks = []
+        try:
+            async for page in self.iter_playlist(playlist_id, limit):
+                tracks.extend(page)
+                if on_page:
+                    ready = info.done() and not info.cancelled() and not info.exception()
+                    await on_page(page, info.result() if ready else None)
+        except RuntimeError:
+            # A missing playlist also fails its item listing; report that instead
+            await info
+            raise
+        finally:
+            info.cancel()
+
+        playlist = {**await info, "tracks": tracks}
+        self._playlist_cache[cache_key] = playlist
+        return playlist
 
-        except Exception as e:
-            logger.error(f"Failed to get playlist: {e}")
-            raise RuntimeError(f"Failed to retrieve playlist: {str(e)}")
+    async def get_playlist(
+        self, playlist_id: str, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get playlist details and all tracks (paginated)"""
+        return await self.stream_playlist(playlist_id, limit=limit)
 
     async def delete_playlist(self, playlist_id: str) -> Dict[str, Any]:
         """Delete a playlist"""
         try:
-            self.youtube.playlists().delete(id=playlist_id).execute()
+            await self._execute(self.youtube.playlists().delete(id=playlist_id))
+            self.invalidate(playlist_id)
             return {"status": "deleted", "playlistId": playlist_id}
         except Exception as e:
-            logger.error(f"Failed to delete playlist: {e}")
+            logger.error("Failed to delete playlist: %s", e)
             raise RuntimeError(f"Failed to delete playlist: {str(e)}")
 
     async def update_playlist(
@@ -258,10 +461,10 @@ class YouTubeMusicClient:
         """Update playlist title and/or description"""
         try:
             # First get current playlist info
-            current = self.youtube.playlists().list(
+            current = await self._execute(self.youtube.playlists().list(
                 part="snippet,status",
                 id=playlist_id,
-            ).execute()
+            ))
 
             if not current.get("items"):
                 raise RuntimeError(f"Playlist not found: {playlist_id}")
@@ -276,14 +479,15 @@ class YouTubeMusicClient:
                 snippet["description"] = description
 
             # Send update
-            result = self.youtube.playlists().update(
+            result = await self._execute(self.youtube.playlists().update(
                 part="snippet,status",
                 body={
                     "id": playlist_id,
                     "snippet": snippet,
                     "status": playlist.get("status", {}),
                 },
-            ).execute()
+            ))
+            self.invalidate(playlist_id)
 
             return {
                 "status": "updated",
@@ -292,18 +496,22 @@ class YouTubeMusicClient:
                 "description": result["snippet"]["description"],
             }
         except Exception as e:
-            logger.error(f"Failed to update playlist: {e}")
+            logger.error("Failed to update playlist: %s", e)
             raise RuntimeError(f"Failed to update playlist: {str(e)}")
 
     async def get_library_playlists(self, limit: int = 25) -> List[Dict[str, Any]]:
         """Get user's playlists"""
+        if limit in self._library_cache:
+            return self._library_cache[limit]
+
         try:
             request = self.youtube.playlists().list(
                 part="snippet,contentDetails",
                 mine=True,
                 maxResults=min(limit, 50),
+                fields=LIBRARY_FIELDS,
             )
-            response = request.execute()
+            response = await self._execute(request)
 
             playlists = []
             for item in response.get("items", []):
@@ -316,10 +524,11 @@ class YouTubeMusicClient:
                     "count": content_details.get("itemCount", 0),
                 })
 
+            self._library_cache[limit] = playlists
             return playlists
 
         except Exception as e:
-            logger.error(f"Failed to get library playlists: {e}")
+            logger.error("Failed to get library playlists: %s", e)
             raise RuntimeError(f"Failed to get library playlists: {str(e)}")
 
     async def search_and_add_to_playlist(
@@ -335,34 +544,46 @@ class YouTubeMusicClient:
         Returns:
             Status with added tracks info
         """
-        video_ids = []
         added_tracks = []
         failed_queries = []
 
-        for query in search_queries:
+        # Searches are independent, so they run concurrently
+        search_results = await asyncio.gather(
+            *(self.search_tracks(query, limit=1, filter="songs") for query in search_queries),
+            return_exceptions=True,
+        )
+
+        # Inserts append to the playlist, so they run in query order
+        for query, results in zip(search_queries, search_results):
+            if isinstance(results, Exception):
+                logger.warning("Search failed for '%s': %s", query, results)
+                failed_queries.append(query)
+                continue
+            if not results or not results[0].get("videoId"):
+                failed_queries.append(query)
+                continue
+
+            track = results[0]
             try:
-                results = await self.search_tracks(query, limit=1, filter="songs")
-                if results and results[0].get("videoId"):
-                    video_id = results[0]["videoId"]
-                    video_ids.append(video_id)
-                    added_tracks.append({
-                        "query": query,
-                        "matched": results[0]["title"],
-                        "artists": [a["name"] for a in results[0].get("artists", [])],
-                        "videoId": video_id,
-                    })
-                else:
-                    failed_queries.append(query)
+                await self._add_video_to_playlist(playlist_id, track["videoId"])
             except Exception as e:
-                logger.warning(f"Search failed for '{query}': {e}")
+                logger.warning("Failed to add video %s for '%s': %s", track["videoId"], query, e)
                 failed_queries.append(query)
+                continue
 
-        if video_ids:
-            await self.add_playlist_items(playlist_id, video_ids)
+            added_tracks.append({
+                "query": query,
+                "matched": track["title"],
+                "artists": [a["name"] for a in track.get("artists", [])],
+                "videoId": track["videoId"],
+            })
+
+        if added_tracks:
+            self.invalidate(playlist_id)
 
         return {
             "status": "completed",
-            "addedCount": len(video_ids),
+            "addedCount": len(added_tracks),
             "addedTracks": added_tracks,
             "failedQueries": failed_queries,
         }
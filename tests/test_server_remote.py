@@ -0,0 +1,173 @@
+"""
+Tests for the remote server's credential cache and token refresh
+"""
+import asyncio
+import json
+import os
+import stat
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+import src.server_remote as server_remote
+from src.ytmusic_client import YouTubeMusicClient
+
+TOKEN = {"token": "access", "client_id": "cid", "client_secret": "secret", "refresh_token": "refresh"}
+
+
+class _Stop(Exception):
+    """Raised by the fake sleep to end keep_credentials_fresh's loop"""
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the credentials cache at a temp dir and set a raw JSON token"""
+    monkeypatch.setattr(server_remote, "CREDENTIALS_CACHE_DIR", tmp_path)
+    monkeypatch.delenv("YOUTUBE_TOKEN_B64", raising=False)
+    monkeypatch.setenv("YOUTUBE_TOKEN_JSON", json.dumps(TOKEN))
+    return tmp_path
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record keep_credentials_fresh's sleeps, stopping the loop at the second one"""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+        if len(delays) == 2:
+            raise _Stop
+
+    monkeypatch.setattr(server_remote, "_sleep", sleep)
+    return delays
+
+
+def _refresh_to(credentials, expiry):
+    """Patch credentials.refresh to issue a new token valid until expiry"""
+    def refresh(request):
+        credentials.token = "refreshed"
+        credentials.expiry = expiry
+    credentials.refresh = refresh
+
+
+def test_credentials_cache_round_trip(cache_dir):
+    """Test that decoded credentials are cached and served from the cache next time"""
+    credentials, cache_path, stale = server_remote.load_credentials()
+    assert stale
+    assert cache_path.parent == cache_dir
+
+    server_remote._save_cached_credentials(credentials, cache_path)
+    cached, cached_path, stale = server_remote.load_credentials()
+
+    assert not stale
+    assert cached_path == cache_path
+    assert (cached.token, cached.refresh_token, cached.client_secret) == ("access", "refresh", "secret")
+
+
+def test_credentials_cache_is_private(cache_dir):
+    """Test that the cache file holding the refresh token is readable only by its owner"""
+    credentials, cache_path, _ = server_remote.load_credentials()
+
+    server_remote._save_cached_credentials(credentials, cache_path)
+
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+    assert os.listdir(cache_dir) == [cache_path.name]
+
+
+def test_new_env_token_bypasses_cache(cache_dir, monkeypatch):
+    """Test that a rotated env token is decoded rather than shadowed by the old cache"""
+    credentials, old_path, _ = server_remote.load_credentials()
+    server_remote._save_cached_credentials(credentials, old_path)
+
+    monkeypatch.setenv("YOUTUBE_TOKEN_JSON", json.dumps({**TOKEN, "refresh_token": "rotated"}))
+    credentials, new_path, stale = server_remote.load_credentials()
+
+    assert new_path != old_path
+    assert stale
+    assert credentials.refresh_token == "rotated"
+
+
+def test_invalid_token_fails_fast(monkeypatch):
+    """Test that an undecodable token is reported at load time"""
+    monkeypatch.delenv("YOUTUBE_TOKEN_JSON")
+    monkeypatch.setenv("YOUTUBE_TOKEN_B64", "!!!notbase64")
+
+    with pytest.raises(RuntimeError, match="Invalid YouTube token"):
+        server_remote.load_credentials()
+
+
+def test_cache_without_expiry_is_refreshed_on_start(cache_dir, monkeypatch):
+    """Test that a first-boot cache (no expiry) is refreshed once and re-cached with one"""
+    credentials, cache_path, _ = server_remote.load_credentials()
+    server_remote._save_cached_credentials(credentials, cache_path)
+    assert "expiry" not in json.loads(cache_path.read_text())
+
+    monkeypatch.setattr(server_remote, "build_youtube", Mock())
+    cached, cache_path, stale = server_remote.load_credentials()
+    assert cached.expired
+    expiry = _utcnow() + timedelta(hours=1)
+    _refresh_to(cached, expiry)
+
+    server_remote.init_youtube_client(cached, cache_path, stale)
+
+    assert json.loads(cache_path.read_text())["token"] == "refreshed"
+    reloaded, _, _ = server_remote.load_credentials()
+    assert not reloaded.expired
+
+
+def test_keep_credentials_fresh_refreshes_before_expiry(cache_dir, sleeps):
+    """Test that the token is refreshed TOKEN_REFRESH_MARGIN seconds before it expires"""
+    credentials, cache_path, _ = server_remote.load_credentials()
+    credentials.expiry = _utcnow() + timedelta(seconds=120)
+    _refresh_to(credentials, _utcnow() + timedelta(hours=1))
+
+    with pytest.raises(_Stop):
+        asyncio.run(server_remote.keep_credentials_fresh(credentials, cache_path))
+
+    margin = server_remote.TOKEN_REFRESH_MARGIN
+    assert 120 - margin - 5 < sleeps[0] <= 120 - margin
+    assert 3600 - margin - 5 < sleeps[1] <= 3600 - margin
+    assert json.loads(cache_path.read_text())["token"] == "refreshed"
+
+
+def test_keep_credentials_fresh_retries_failed_refresh(cache_dir, sleeps):
+    """Test that a failed refresh is retried after TOKEN_REFRESH_RETRY seconds"""
+    credentials, cache_path, _ = server_remote.load_credentials()
+    credentials.expiry = _utcnow() - timedelta(seconds=1)
+    credentials.refresh = Mock(side_effect=Exception("offline"))
+
+    with pytest.raises(_Stop):
+        asyncio.run(server_remote.keep_credentials_fresh(credentials, cache_path))
+
+    assert sleeps == [0, server_remote.TOKEN_REFRESH_RETRY]
+    assert credentials.refresh.call_count == 1
+    assert not cache_path.exists()
+
+
+def test_playlist_details_reuses_cached_playlist(monkeypatch):
+    """Test that repeated get_playlist_details calls hit the API once"""
+    youtube = Mock()
+    youtube.playlists.return_value.list.return_value.execute.return_value = {
+        "items": [{"snippet": {"title": "My Playlist"}, "contentDetails": {"itemCount": 1}}]
+    }
+    items_list = youtube.playlistItems.return_value.list
+    items_list.return_value.execute.return_value = {
+        "items": [{"snippet": {"title": "Track 1", "resourceId": {"videoId": "v1"}}}]
+    }
+    youtube.videos.return_value.list.return_value.execute.return_value = {"items": []}
+    monkeypatch.setattr(server_remote, "ytmusic_client", YouTubeMusicClient(youtube))
+    handler = server_remote._HANDLERS["get_playlist_details"]
+
+    async def read_twice():
+        return [await handler({"playlist_id": "PL1"}) for _ in range(2)]
+
+    first, second = asyncio.run(read_twice())
+
+    assert items_list.call_count == 1
+    assert [c.text for c in first] == [c.text for c in second]
+    assert "Track 1" in second[1].text
@@ -1,220 +1,664 @@
 """
 Tests for YouTube Music client wrapper
-"""
-import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from src.ytmusic_client import YouTubeMusicClient
 
+PYTEST_DONT_REWRITE: the assertions here are plain equality checks on
+mocked data, so pytest's assertion rewriting is skipped for this module.
+"""
+import asyncio
+import functools
+import threading
+import time
+from types import MappingProxyType
 
-@pytest.fixture
-def mock_ytmusic():
-    """Mock YTMusic instance"""
-    mock = Mock()
-    return mock
+import pytest
+from unittest.mock import Mock, call
+from src.ytmusic_client import SEARCH_FIELDS, YouTubeMusicClient
 
 
-@pytest.fixture
-def client(mock_ytmusic):
-    """Create client with mocked YTMusic"""
-    return YouTubeMusicClient(mock_ytmusic)
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
-@pytest.mark.asyncio
-async def test_search_tracks_returns_normalized_results(client, mock_ytmusic):
-    """Test that search returns properly normalized results"""
-    mock_ytmusic.search.return_value = [
+# Canned API responses, built once at import and shared read-only between tests
+_SEARCH_RESPONSE = _freeze({
+    "items": [
         {
-            "videoId": "test123",
-            "title": "Test Song",
-            "artists": [{"name": "Test Artist", "id": "artist123"}],
-            "album": {"name": "Test Album"},
-            "duration": "3:45",
-            "thumbnails": [{"url": "http://example.com/thumb.jpg"}],
+            "id": {"videoId": "test123"},
+            "snippet": {
+                "title": "Test Song",
+                "channelTitle": "Test Artist",
+                "channelId": "artist123",
+                "description": "Test description",
+                "thumbnails": {"default": {"url": "http://example.com/thumb.jpg"}},
+                "publishedAt": "2020-01-01T00:00:00Z",
+            },
         }
     ]
+})
+_MINIMAL_SEARCH_RESPONSE = _freeze({
+    "items": [
+        {
+            "id": {"videoId": "vid1"},
+            "snippet": {"title": "Song Without Details"},
+            # No channel, description, thumbnails or publish date
+        }
+    ]
+})
+_SEARCH_AND_ADD_RESPONSES = _freeze({
+    "query1": {"items": [{"id": {"videoId": "vid1"}, "snippet": {"title": "Song 1", "channelTitle": "Artist 1"}}]},
+    "query2": {"items": [{"id": {"videoId": "vid2"}, "snippet": {"title": "Song 2", "channelTitle": "Artist 2"}}]},
+})
 
-    results = await client.search_tracks("test query")
 
-    assert len(results) == 1
-    assert results[0]["videoId"] == "test123"
-    assert results[0]["title"] == "Test Song"
-    assert results[0]["artists"][0]["name"] == "Test Artist"
-    assert results[0]["album"] == "Test Album"
-    assert results[0]["duration"] == "3:45"
-    mock_ytmusic.search.assert_called_once_with("test query", filter="songs", limit=20)
+# Playlist ID shared by the tests
+PL = "PL_test123"
 
+# One event loop for the whole module, reused by every test
+_LOOP = asyncio.new_event_loop()
 
-@pytest.mark.asyncio
-async def test_search_tracks_with_custom_limit_and_filter(client, mock_ytmusic):
-    """Test search with custom parameters"""
-    mock_ytmusic.search.return_value = []
 
-    await client.search_tracks("query", limit=5, filter="albums")
+def run(coro):
+    """Run a coroutine to completion on the module's event loop"""
+    return _LOOP.run_until_complete(coro)
 
-    mock_ytmusic.search.assert_called_once_with("query", filter="albums", limit=5)
 
+async def _collect(pages):
+    """Gather everything an async iterator yields into a list"""
+    return [page async for page in pages]
 
-@pytest.mark.asyncio
-async def test_search_tracks_handles_missing_fields(client, mock_ytmusic):
-    """Test that search handles items with missing optional fields"""
-    mock_ytmusic.search.return_value = [
-        {
-            "videoId": "vid1",
-            "title": "Song Without Album",
-            "artists": [],
-            # No album, duration, or thumbnails
-        }
-    ]
 
-    results = await client.search_tracks("query")
+def _request(resource, collection, method):
+    """Return the mock request object built by resource.collection().method(...)"""
+    return getattr(getattr(resource, collection).return_value, method).return_value
 
-    assert len(results) == 1
-    assert results[0]["album"] is None
-    assert results[0]["artists"] == []
 
+def _search_responses(resource, responses):
+    """Serve search().list() responses keyed by query, whatever order searches run in"""
+    def list_(**kwargs):
+        request = Mock()
+        # search_tracks appends " music" to song queries
+        response = responses[kwargs["q"].removesuffix(" music")]
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
 
-@pytest.mark.asyncio
-async def test_search_tracks_raises_on_error(client, mock_ytmusic):
-    """Test that search raises RuntimeError on API failure"""
-    mock_ytmusic.search.side_effect = Exception("API Error")
+    resource.search.return_value.list.side_effect = list_
 
-    with pytest.raises(RuntimeError, match="Search failed"):
-        await client.search_tracks("query")
 
+def _record_inserts(resource, failing=()):
+    """Record (playlistId, videoId) as each playlistItems insert executes
 
-@pytest.mark.asyncio
-async def test_create_playlist_success(client, mock_ytmusic):
-    """Test successful playlist creation"""
-    mock_ytmusic.create_playlist.return_value = "PL_test123"
+    Earlier inserts take longer, so inserts that overlap would land out of order.
+    """
+    inserted = []
 
-    result = await client.create_playlist(
-        title="Test Playlist", description="Test Description"
-    )
+    def insert(part, body):
+        snippet = body["snippet"]
+        video_id = snippet["resourceId"]["videoId"]
+        delay = 0.02 / (len(inserted) + 1)
+
+        def execute():
+            time.sleep(delay)
+            if video_id in failing:
+                raise Exception("Insert failed")
+            inserted.append((snippet["playlistId"], video_id))
+            return {"id": "item"}
+
+        request = Mock()
+        request.execute.side_effect = execute
+        return request
+
+    resource.playlistItems.return_value.insert.side_effect = insert
+    return inserted
+
+
+class _SearchStub:
+    """Bare stand-in for the YouTube resource on the search().list().execute() path"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.response = {"items": []}
+        self.calls = []
+
+    def search(self):
+        return self
+
+    def list(self, **kwargs):
+        self.calls.append(kwargs)
+        return self
+
+    def execute(self):
+        return self.response
+
+
+# Fake resources by id(), so clients can be memoized on a hashable key
+_RESOURCES = {}
+
+
+@functools.cache
+def _make_client(resource_id):
+    """Build one client per fake resource, however many fixtures ask for it"""
+    return YouTubeMusicClient(_RESOURCES[resource_id])
 
-    assert result["playlistId"] == "PL_test123"
-    assert result["title"] == "Test Playlist"
-    assert result["status"] == "created"
-    assert "youtube.com" in result["url"]
-    assert "PL_test123" in result["url"]
 
+def _client_for(resource):
+    _RESOURCES[id(resource)] = resource
+    return _make_client(id(resource))
 
-@pytest.mark.asyncio
-async def test_create_playlist_with_initial_tracks(client, mock_ytmusic):
+
+@pytest.fixture(scope="module")
+def mock_ytmusic():
+    """Mock YouTube Data API resource, limited to the collections the client uses"""
+    return Mock(spec_set=("search", "playlists", "playlistItems", "videos"))
+
+
+@pytest.fixture(scope="module")
+def fast_ytmusic():
+    """Search stub for tests that only exercise search_tracks"""
+    return _SearchStub()
+
+
+@pytest.fixture
+def client(mock_ytmusic):
+    """Client wrapping the mocked YouTube resource"""
+    return _client_for(mock_ytmusic)
+
+
+@pytest.fixture
+def search_client(fast_ytmusic):
+    """Client wrapping the search stub"""
+    return _client_for(fast_ytmusic)
+
+
+@pytest.fixture(autouse=True)
+def _reset(mock_ytmusic, fast_ytmusic):
+    """Isolate tests sharing the module-scoped fakes and their clients"""
+    yield
+    mock_ytmusic.reset_mock(return_value=True, side_effect=True)
+    fast_ytmusic.reset()
+    _client_for(mock_ytmusic).clear_cache()
+    _client_for(fast_ytmusic).clear_cache()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _forget_clients():
+    yield
+    _make_client.cache_clear()
+    _RESOURCES.clear()
+    _LOOP.close()
+
+
+@pytest.mark.parametrize("response,expected", [
+    (_SEARCH_RESPONSE, {
+        "videoId": "test123",
+        "title": "Test Song",
+        "artists": [{"name": "Test Artist", "id": "artist123"}],
+        "description": "Test description",
+        "thumbnails": {"default": {"url": "http://example.com/thumb.jpg"}},
+        "publishedAt": "2020-01-01T00:00:00Z",
+    }),
+    (_MINIMAL_SEARCH_RESPONSE, {
+        "videoId": "vid1",
+        "title": "Song Without Details",
+        "artists": [{"name": None, "id": None}],
+        "description": "",
+        "thumbnails": {},
+        "publishedAt": None,
+    }),
+], ids=["full", "missing-fields"])
+def test_search_tracks_returns_normalized_results(search_client, fast_ytmusic, response, expected):
+    """Test that search normalizes results, defaulting missing optional fields"""
+    fast_ytmusic.response = response
+
+    results = run(search_client.search_tracks("test query"))
+
+    assert results == [expected]
+    assert fast_ytmusic.calls == [dict(
+        part="snippet",
+        q="test query music",
+        type="video",
+        maxResults=20,
+        videoCategoryId="10",
+        fields=SEARCH_FIELDS,
+    )]
+
+
+def test_search_tracks_with_custom_limit_and_filter(search_client, fast_ytmusic):
+    """Test search with custom parameters"""
+    run(search_client.search_tracks("query", limit=5, filter="playlists"))
+
+    assert fast_ytmusic.calls == [dict(
+        part="snippet",
+        q="query",
+        type="playlist",
+        maxResults=5,
+        videoCategoryId=None,
+        fields=SEARCH_FIELDS,
+    )]
+
+
+# Simple cases: one API response in, one client result out
+CASES = [
+    {
+        "id": "create_playlist",
+        "request": ("playlists", "insert"),
+        "response": {"id": PL},
+        "call": lambda c: c.create_playlist(title="Test Playlist", description="Test Description"),
+        "expected": {
+            "playlistId": PL,
+            "title": "Test Playlist",
+            "status": "created",
+            "url": f"https://www.youtube.com/playlist?list={PL}",
+        },
+    },
+    {
+        "id": "add_playlist_items",
+        "request": ("playlistItems", "insert"),
+        "response": {"id": "item"},
+        "call": lambda c: c.add_playlist_items(playlist_id=PL, video_ids=["video1", "video2"]),
+        "expected": {
+            "status": "success",
+            "playlistId": PL,
+            "addedCount": 2,
+            "requestedCount": 2,
+        },
+    },
+    {
+        "id": "delete_playlist",
+        "request": ("playlists", "delete"),
+        "response": {},
+        "call": lambda c: c.delete_playlist(PL),
+        "expected": {"status": "deleted", "playlistId": PL},
+    },
+    {
+        "id": "get_library_playlists",
+        "request": ("playlists", "list"),
+        "response": {
+            "items": [
+                {"id": "PL1", "snippet": {"title": "Playlist 1"}, "contentDetails": {"itemCount": 5}},
+                {"id": "PL2", "snippet": {"title": "Playlist 2"}, "contentDetails": {"itemCount": 10}},
+            ]
+        },
+        "call": lambda c: c.get_library_playlists(),
+        "expected": [
+            {"playlistId": "PL1", "title": "Playlist 1", "description": "", "count": 5},
+            {"playlistId": "PL2", "title": "Playlist 2", "description": "", "count": 10},
+        ],
+    },
+]
+
+
+def pytest_generate_tests(metafunc):
+    if "case" in metafunc.fixturenames:
+        metafunc.parametrize("case", CASES, ids=[c["id"] for c in CASES])
+
+
+def test_client_case(case, client, mock_ytmusic):
+    """Test a client call against its canned API response"""
+    _request(mock_ytmusic, *case["request"]).execute.return_value = case["response"]
+
+    assert run(case["call"](client)) == case["expected"]
+
+
+def test_search_tracks_serves_repeat_queries_from_cache(client, mock_ytmusic):
+    """Test that an identical search is answered from the cache"""
+    request = _request(mock_ytmusic, "search", "list")
+    request.execute.return_value = {
+        "items": [{"id": {"videoId": "vid1"}, "snippet": {"title": "Cached Song"}}]
+    }
+
+    first = run(client.search_tracks("query"))
+    second = run(client.search_tracks("query"))
+
+    assert second == first
+    assert request.execute.call_count == 1
+
+
+def test_requests_execute_off_event_loop(client, mock_ytmusic):
+    """Test that blocking API calls run in a worker thread"""
+    threads = []
+
+    def execute():
+        threads.append(threading.get_ident())
+        return {"items": []}
+
+    _request(mock_ytmusic, "search", "list").execute.side_effect = execute
+
+    run(client.search_tracks("query"))
+
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.parametrize("collection,method,call,match", [
+    ("search", "list", lambda c: c.search_tracks("query"), "Search failed"),
+    ("playlists", "insert", lambda c: c.create_playlist(title="Test"), "Failed to create playlist"),
+    ("playlists", "delete", lambda c: c.delete_playlist(PL), "Failed to delete playlist"),
+    ("playlists", "list", lambda c: c.get_library_playlists(), "Failed to get library playlists"),
+], ids=["search", "create_playlist", "delete_playlist", "get_library_playlists"])
+def test_raises_on_api_error(client, mock_ytmusic, collection, method, call, match):
+    """Test that API failures are raised as RuntimeError"""
+    _request(mock_ytmusic, collection, method).execute.side_effect = Exception("API Error")
+
+    with pytest.raises(RuntimeError, match=match):
+        run(call(client))
+
+
+def test_create_playlist_with_initial_tracks(client, mock_ytmusic):
     """Test playlist creation with initial video IDs"""
-    mock_ytmusic.create_playlist.return_value = "PL_new"
+    _request(mock_ytmusic, "playlists", "insert").execute.return_value = {"id": "PL_new"}
+    inserted = _record_inserts(mock_ytmusic)
 
-    await client.create_playlist(
+    run(client.create_playlist(
         title="My Playlist",
         video_ids=["vid1", "vid2"],
         privacy_status="PUBLIC",
-    )
+    ))
 
-    mock_ytmusic.create_playlist.assert_called_once_with(
-        title="My Playlist",
-        description="",
-        privacy_status="PUBLIC",
-        video_ids=["vid1", "vid2"],
-    )
+    assert mock_ytmusic.playlists.return_value.insert.call_args_list == [call(
+        part="snippet,status",
+        body={
+            "snippet": {"title": "My Playlist", "description": ""},
+            "status": {"privacyStatus": "public"},
+        },
+    )]
+    assert inserted == [("PL_new", "vid1"), ("PL_new", "vid2")]
 
 
-@pytest.mark.asyncio
-async def test_create_playlist_raises_on_error(client, mock_ytmusic):
-    """Test that playlist creation raises RuntimeError on failure"""
-    mock_ytmusic.create_playlist.side_effect = Exception("Creation failed")
+def test_create_playlist_reports_failed_initial_tracks(client, mock_ytmusic):
+    """Test that a failed initial insert still reports the playlist as created"""
+    _request(mock_ytmusic, "playlists", "insert").execute.return_value = {"id": "PL_new"}
+    inserted = _record_inserts(mock_ytmusic, failing={"vid2"})
 
-    with pytest.raises(RuntimeError, match="Failed to create playlist"):
-        await client.create_playlist(title="Test")
+    result = run(client.create_playlist(title="My Playlist", video_ids=["vid1", "vid2", "vid3"]))
 
+    assert result["status"] == "created"
+    assert result["playlistId"] == "PL_new"
+    assert (result["addedCount"], result["requestedCount"]) == (2, 3)
+    assert inserted == [("PL_new", "vid1"), ("PL_new", "vid3")]
 
-@pytest.mark.asyncio
-async def test_add_playlist_items_success(client, mock_ytmusic):
-    """Test adding items to playlist"""
-    mock_ytmusic.add_playlist_items.return_value = {"status": "ok"}
 
-    result = await client.add_playlist_items(
-        playlist_id="PL_test123", video_ids=["video1", "video2"]
-    )
+def test_add_playlist_items_skips_failed_videos(client, mock_ytmusic):
+    """Test that a failed insert is skipped and left out of the added count"""
+    _request(mock_ytmusic, "playlistItems", "insert").execute.side_effect = [
+        {"id": "item"},
+        Exception("Add failed"),
+    ]
 
-    assert result["status"] == "success"
-    assert result["addedCount"] == 2
-    assert result["playlistId"] == "PL_test123"
+    result = run(client.add_playlist_items(PL, ["vid1", "vid2"]))
+
+    assert result["addedCount"] == 1
+    assert result["requestedCount"] == 2
 
 
-@pytest.mark.asyncio
-async def test_add_playlist_items_raises_on_error(client, mock_ytmusic):
-    """Test that adding items raises RuntimeError on failure"""
-    mock_ytmusic.add_playlist_items.side_effect = Exception("Add failed")
+def test_add_playlist_items_keeps_order(client, mock_ytmusic):
+    """Test that tracks are inserted one at a time, in the order given"""
+    inserted = _record_inserts(mock_ytmusic)
 
-    with pytest.raises(RuntimeError, match="Failed to add tracks"):
-        await client.add_playlist_items("PL_test", ["vid1"])
+    result = run(client.add_playlist_items(PL, [f"v{i}" for i in range(8)]))
 
+    assert result["addedCount"] == 8
+    assert inserted == [(PL, f"v{i}") for i in range(8)]
 
-@pytest.mark.asyncio
-async def test_get_playlist_success(client, mock_ytmusic):
+
+def test_get_playlist_success(client, mock_ytmusic):
     """Test getting playlist details"""
-    mock_ytmusic.get_playlist.return_value = {
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [
+            {
+                "snippet": {"title": "My Playlist", "description": "A cool playlist"},
+                "contentDetails": {"itemCount": 10},
+            }
+        ]
+    }
+    _request(mock_ytmusic, "playlistItems", "list").execute.return_value = {
+        "items": [
+            {"snippet": {"title": "Track 1", "position": 0, "resourceId": {"videoId": "v1"}}},
+            {"snippet": {"title": "Track 2", "position": 1, "resourceId": {"videoId": "v2"}}},
+        ]
+    }
+
+    _request(mock_ytmusic, "videos", "list").execute.return_value = {"items": []}
+
+    result = run(client.get_playlist(PL))
+
+    assert result == {
+        "id": PL,
         "title": "My Playlist",
         "description": "A cool playlist",
         "trackCount": 10,
-        "tracks": [{"title": "Track 1"}, {"title": "Track 2"}],
+        "tracks": [
+            {"title": "Track 1", "videoId": "v1", "artists": [{"name": ""}], "position": 0},
+            {"title": "Track 2", "videoId": "v2", "artists": [{"name": ""}], "position": 1},
+        ],
     }
 
-    result = await client.get_playlist("PL_test123")
 
-    assert result["id"] == "PL_test123"
-    assert result["title"] == "My Playlist"
-    assert result["trackCount"] == 10
-    assert len(result["tracks"]) == 2
+def test_get_playlist_adds_track_details(client, mock_ytmusic):
+    """Test that durations and missing artists come from one videos.list call per page"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [{"snippet": {"title": "My Playlist"}, "contentDetails": {"itemCount": 3}}]
+    }
+    _request(mock_ytmusic, "playlistItems", "list").execute.return_value = {
+        "items": [
+            {"snippet": {"title": "Track 1", "videoOwnerChannelTitle": "Artist 1",
+                         "resourceId": {"videoId": "v1"}}},
+            {"snippet": {"title": "Track 2", "resourceId": {"videoId": "v2"}}},
+            {"snippet": {"title": "Live Stream", "resourceId": {"videoId": "v3"}}},
+        ]
+    }
+    videos_request = _request(mock_ytmusic, "videos", "list")
+    videos_request.execute.return_value = {
+        "items": [
+            {"id": "v1", "snippet": {"channelTitle": "Channel 1"},
+             "contentDetails": {"duration": "PT4M13S"}},
+            {"id": "v2", "snippet": {"channelTitle": "Channel 2"},
+             "contentDetails": {"duration": "PT1H2M3S"}},
+            {"id": "v3", "snippet": {"channelTitle": "Channel 3"},
+             "contentDetails": {"duration": "P0D"}},
+        ]
+    }
 
+    result = run(client.get_playlist(PL))
 
-@pytest.mark.asyncio
-async def test_get_library_playlists_success(client, mock_ytmusic):
-    """Test getting library playlists"""
-    mock_ytmusic.get_library_playlists.return_value = [
-        {"playlistId": "PL1", "title": "Playlist 1", "count": 5},
-        {"playlistId": "PL2", "title": "Playlist 2", "count": 10},
+    assert mock_ytmusic.videos.return_value.list.call_count == 1
+    assert mock_ytmusic.videos.return_value.list.call_args.kwargs["id"] == "v1,v2,v3"
+    assert [t["duration"] for t in result["tracks"]] == ["4:13", "1:02:03", None]
+    assert [t["artists"][0]["name"] for t in result["tracks"]] == ["Artist 1", "Channel 2", "Channel 3"]
+
+
+def test_get_video_details_batches_ids(client, mock_ytmusic):
+    """Test that video lookups are split into requests of at most 50 IDs"""
+    _request(mock_ytmusic, "videos", "list").execute.return_value = {"items": []}
+
+    run(client.get_video_details([f"v{i}" for i in range(120)]))
+
+    id_counts = sorted(
+        len(c.kwargs["id"].split(","))
+        for c in mock_ytmusic.videos.return_value.list.call_args_list
+    )
+    assert id_counts == [20, 50, 50]
+
+
+def test_get_playlist_follows_pages(client, mock_ytmusic):
+    """Test that tracks from every page are collected in order"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [{"snippet": {"title": "Long Playlist"}, "contentDetails": {"itemCount": 3}}]
+    }
+    _request(mock_ytmusic, "playlistItems", "list").execute.side_effect = [
+        {
+            "items": [
+                {"snippet": {"title": "Track 1", "resourceId": {"videoId": "v1"}}},
+                {"snippet": {"title": "Track 2", "resourceId": {"videoId": "v2"}}},
+            ],
+            "nextPageToken": "page2",
+        },
+        {"items": [{"snippet": {"title": "Track 3", "resourceId": {"videoId": "v3"}}}]},
     ]
 
-    result = await client.get_library_playlists()
+    result = run(client.get_playlist(PL))
 
-    assert len(result) == 2
-    assert result[0]["playlistId"] == "PL1"
-    assert result[1]["title"] == "Playlist 2"
+    assert [t["videoId"] for t in result["tracks"]] == ["v1", "v2", "v3"]
+    page_tokens = [
+        c.kwargs["pageToken"]
+        for c in mock_ytmusic.playlistItems.return_value.list.call_args_list
+    ]
+    assert page_tokens == [None, "page2"]
 
 
-@pytest.mark.asyncio
-async def test_search_and_add_to_playlist_success(client, mock_ytmusic):
-    """Test the combined search and add operation"""
-    # Mock search results
-    mock_ytmusic.search.side_effect = [
-        [{"videoId": "vid1", "title": "Song 1", "artists": [{"name": "Artist 1", "id": "a1"}]}],
-        [{"videoId": "vid2", "title": "Song 2", "artists": [{"name": "Artist 2", "id": "a2"}]}],
+def test_get_playlist_stops_paging_at_limit(client, mock_ytmusic):
+    """Test that no further pages are requested once the limit is reached"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [{"snippet": {"title": "Long Playlist"}, "contentDetails": {"itemCount": 3}}]
+    }
+    items_request = _request(mock_ytmusic, "playlistItems", "list")
+    items_request.execute.return_value = {
+        "items": [
+            {"snippet": {"title": "Track 1", "resourceId": {"videoId": "v1"}}},
+            {"snippet": {"title": "Track 2", "resourceId": {"videoId": "v2"}}},
+        ],
+        "nextPageToken": "page2",
+    }
+
+    result = run(client.get_playlist(PL, limit=1))
+
+    assert [t["videoId"] for t in result["tracks"]] == ["v1"]
+    assert items_request.execute.call_count == 1
+
+
+def test_iter_playlist_yields_one_list_per_page(client, mock_ytmusic):
+    """Test that tracks are streamed page by page"""
+    _request(mock_ytmusic, "playlistItems", "list").execute.side_effect = [
+        {
+            "items": [
+                {"snippet": {"title": "Track 1", "resourceId": {"videoId": "v1"}}},
+                {"snippet": {"title": "Track 2", "resourceId": {"videoId": "v2"}}},
+            ],
+            "nextPageToken": "page2",
+        },
+        {"items": [{"snippet": {"title": "Track 3", "resourceId": {"videoId": "v3"}}}]},
     ]
-    mock_ytmusic.add_playlist_items.return_value = {"status": "ok"}
 
-    result = await client.search_and_add_to_playlist(
-        playlist_id="PL_test", search_queries=["query1", "query2"]
-    )
+    pages = run(_collect(client.iter_playlist(PL)))
 
-    assert result["status"] == "completed"
-    assert result["addedCount"] == 2
-    assert len(result["addedTracks"]) == 2
-    assert result["failedQueries"] == []
+    assert [[t["videoId"] for t in page] for page in pages] == [["v1", "v2"], ["v3"]]
 
 
-@pytest.mark.asyncio
-async def test_search_and_add_handles_failed_searches(client, mock_ytmusic):
-    """Test that failed searches are tracked properly"""
-    mock_ytmusic.search.side_effect = [
-        [{"videoId": "vid1", "title": "Found Song", "artists": []}],
-        [],  # No results for second query
+def test_stream_playlist_reports_each_page(client, mock_ytmusic):
+    """Test that stream_playlist hands each page to the callback and returns everything"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [{"snippet": {"title": "My Playlist"}, "contentDetails": {"itemCount": 3}}]
+    }
+    _request(mock_ytmusic, "playlistItems", "list").execute.side_effect = [
+        {
+            "items": [{"snippet": {"title": "Track 1", "resourceId": {"videoId": "v1"}}}],
+            "nextPageToken": "page2",
+        },
+        {"items": [{"snippet": {"title": "Track 2", "resourceId": {"videoId": "v2"}}}]},
     ]
-    mock_ytmusic.add_playlist_items.return_value = {"status": "ok"}
+    pages = []
 
-    result = await client.search_and_add_to_playlist(
-        playlist_id="PL_test", search_queries=["found", "not found"]
-    )
+    async def on_page(page, info):
+        pages.append([t["videoId"] for t in page])
 
-    assert result["addedCount"] == 1
-    assert len(result["addedTracks"]) == 1
-    assert "not found" in result["failedQueries"]
+    result = run(client.stream_playlist(PL, on_page))
+
+    assert pages == [["v1"], ["v2"]]
+    assert result["title"] == "My Playlist"
+    assert [t["videoId"] for t in result["tracks"]] == ["v1", "v2"]
+
+    # A cached playlist is reported as a single page without another fetch
+    _request(mock_ytmusic, "playlistItems", "list").execute.side_effect = AssertionError("refetched")
+    run(client.stream_playlist(PL, on_page))
+    assert pages[2:] == [["v1", "v2"]]
+
+
+def test_get_playlist_not_found(client, mock_ytmusic):
+    """Test that a missing playlist raises RuntimeError"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {"items": []}
+    _request(mock_ytmusic, "playlistItems", "list").execute.side_effect = Exception("404")
+
+    with pytest.raises(RuntimeError, match="Playlist not found"):
+        run(client.get_playlist("PL_missing"))
+
+
+def test_playlist_changes_invalidate_cached_playlist(client, mock_ytmusic):
+    """Test that adding tracks drops the cached copy of that playlist"""
+    _request(mock_ytmusic, "playlists", "list").execute.return_value = {
+        "items": [{"snippet": {"title": "My Playlist"}, "contentDetails": {"itemCount": 0}}]
+    }
+    items_request = _request(mock_ytmusic, "playlistItems", "list")
+    items_request.execute.return_value = {"items": []}
+    _request(mock_ytmusic, "playlistItems", "insert").execute.return_value = {"id": "item"}
+
+    run(client.get_playlist(PL))
+    run(client.get_playlist(PL))
+    assert items_request.execute.call_count == 1
+
+    run(client.add_playlist_items(PL, ["vid1"]))
+    run(client.get_playlist(PL))
+    assert items_request.execute.call_count == 2
+
+
+def test_search_and_add_to_playlist_success(client, mock_ytmusic):
+    """Test the combined search and add operation"""
+    _search_responses(mock_ytmusic, _SEARCH_AND_ADD_RESPONSES)
+    inserted = _record_inserts(mock_ytmusic)
+
+    result = run(client.search_and_add_to_playlist(
+        playlist_id=PL, search_queries=["query1", "query2"]
+    ))
+
+    added, tracks, failed = result["addedCount"], result["addedTracks"], result["failedQueries"]
+    assert result["status"] == "completed"
+    assert added == 2
+    assert [t["matched"] for t in tracks] == ["Song 1", "Song 2"]
+    assert failed == []
+    assert inserted == [(PL, "vid1"), (PL, "vid2")]
+
+
+def test_search_and_add_handles_failed_searches(client, mock_ytmusic):
+    """Test that failed searches are tracked properly"""
+    _search_responses(mock_ytmusic, {
+        "found": {"items": [{"id": {"videoId": "vid1"}, "snippet": {"title": "Found Song"}}]},
+        "not found": {"items": []},  # No results for second query
+        "broken": Exception("API Error"),
+    })
+    _request(mock_ytmusic, "playlistItems", "insert").execute.return_value = {"id": "item"}
+
+    result = run(client.search_and_add_to_playlist(
+        playlist_id=PL, search_queries=["found", "not found", "broken"]
+    ))
+
+    added, tracks, failed = result["addedCount"], result["addedTracks"], result["failedQueries"]
+    assert added == 1
+    assert len(tracks) == 1
+    assert failed == ["not found", "broken"]
+
+
+def test_search_and_add_reports_failed_inserts(client, mock_ytmusic):
+    """Test that a query whose insert fails is reported as failed"""
+    _search_responses(mock_ytmusic, {
+        "good": {"items": [{"id": {"videoId": "vid1"}, "snippet": {"title": "Good Song"}}]},
+        "bad": {"items": [{"id": {"videoId": "vid2"}, "snippet": {"title": "Bad Song"}}]},
+    })
+
+    inserted = _record_inserts(mock_ytmusic, failing={"vid2"})
+
+    result = run(client.search_and_add_to_playlist(
+        playlist_id=PL, search_queries=["good", "bad"]
+    ))
+
+    added, tracks, failed = result["addedCount"], result["addedTracks"], result["failedQueries"]
+    assert added == 1
+    assert [t["videoId"] for t in tracks] == ["vid1"]
+    assert failed == ["bad"]
+    assert inserted == [(PL, "vid1")]